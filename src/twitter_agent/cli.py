@@ -4,12 +4,13 @@ import random
 import sys
 import time
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
 import typer
 from dotenv import load_dotenv
 
-from . import db, memory
+from . import db, export, memory
 from .agent import TwitterAgent
 from .poster import post_to_x
 
@@ -44,13 +45,29 @@ def memory_add(
 @memory_app.command("list")
 def memory_list(
     limit: Optional[int] = typer.Option(None, "--limit", help="Maximum number of entries to show."),
+    key: Optional[str] = typer.Option(None, "--key", "-k", help="Only show entries with this key."),
+    before_id: Optional[int] = typer.Option(None, "--before-id", help="Only show entries older than this id."),
+    after: Optional[datetime] = typer.Option(None, "--after", help="Only show entries created on or after this date."),
+    until: Optional[datetime] = typer.Option(None, "--until", help="Only show entries created before this date."),
 ) -> None:
-    entries = memory.recall(limit=limit)
-    if not entries:
-        typer.echo("Memory is empty.")
+    if limit:
+        entries = db.list_memory(limit=limit, key=key, before_id=before_id, after=after, until=until)
+        if not entries:
+            typer.echo("Memory is empty.")
+            return
+        for entry in entries:
+            typer.echo(f"[{entry.created_at:%Y-%m-%d %H:%M}] {entry.key}: {entry.value}")
+        if len(entries) >= limit:
+            typer.echo(f"Older entries: --before-id {entries[0].id}")
         return
-    for entry in entries:
-        typer.echo(f"[{entry.created_at:%Y-%m-%d %H:%M}] {entry.key}: {entry.value}")
+
+    # Without a limit, stream rows instead of loading the whole table.
+    shown = False
+    for row in db.iter_memory(key=key, before_id=before_id, after=after, until=until):
+        typer.echo(f"[{row['created_at']:%Y-%m-%d %H:%M}] {row['key']}: {row['value']}")
+        shown = True
+    if not shown:
+        typer.echo("Memory is empty.")
 
 
 @app.command()
@@ -185,10 +202,15 @@ def autoloop(
 @app.command("history")
 def history(
     limit: int = typer.Option(10, "--limit", help="Number of stored tweets to display."),
+    topic: Optional[str] = typer.Option(None, "--topic", "-t", help="Only show tweets drafted for this topic."),
+    model: Optional[str] = typer.Option(None, "--model", "-m", help="Only show tweets drafted by this model."),
+    before_id: Optional[int] = typer.Option(None, "--before-id", help="Only show tweets older than this id."),
+    after: Optional[datetime] = typer.Option(None, "--after", help="Only show tweets created on or after this date."),
+    until: Optional[datetime] = typer.Option(None, "--until", help="Only show tweets created before this date."),
 ) -> None:
-    with db.session_scope() as session:
-        query = session.query(db.TweetRecord).order_by(db.TweetRecord.created_at.desc()).limit(limit)
-        tweets = list(query.all())
+    tweets = db.list_tweets(
+        limit=limit, topic=topic, model=model, before_id=before_id, after=after, until=until
+    )
 
     if not tweets:
         typer.echo("No tweets have been drafted yet.")
@@ -197,6 +219,55 @@ def history(
     for record in tweets:
         typer.echo(f"[{record.created_at:%Y-%m-%d %H:%M}] ({record.topic or 'general'}) {record.content}")
 
+    if len(tweets) >= limit:
+        typer.echo(f"Older tweets: --before-id {tweets[-1].id}")
+
+
+@app.command("export")
+def export_records(
+    kind: str = typer.Argument(..., help="What to export: 'tweets' or 'memories'."),
+    fmt: str = typer.Option("jsonl", "--format", "-f", help="Output format: 'jsonl' or 'csv'."),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="File to write (default: stdout)."),
+    topic: Optional[str] = typer.Option(None, "--topic", "-t", help="Only export tweets for this topic."),
+    model: Optional[str] = typer.Option(None, "--model", "-m", help="Only export tweets drafted by this model."),
+    key: Optional[str] = typer.Option(None, "--key", "-k", help="Only export memory entries with this key."),
+    after_id: Optional[int] = typer.Option(None, "--after-id", help="Resume after this id."),
+    before_id: Optional[int] = typer.Option(None, "--before-id", help="Stop before this id."),
+    after: Optional[datetime] = typer.Option(None, "--after", help="Only export rows created on or after this date."),
+    until: Optional[datetime] = typer.Option(None, "--until", help="Only export rows created before this date."),
+    batch_size: int = typer.Option(1000, "--batch-size", help="Rows fetched from the database per batch."),
+) -> None:
+    if fmt not in export.FORMATS:
+        typer.echo(f"Unknown format '{fmt}'. Choose from: {', '.join(export.FORMATS)}.", err=True)
+        raise typer.Exit(code=1)
+    if batch_size < 1:
+        typer.echo("batch-size must be at least 1.", err=True)
+        raise typer.Exit(code=1)
+
+    bounds = dict(before_id=before_id, after_id=after_id, after=after, until=until, batch_size=batch_size)
+    if kind == "tweets":
+        if key:
+            typer.echo("--key only applies to memories.", err=True)
+            raise typer.Exit(code=1)
+        rows = db.iter_tweets(topic=topic, model=model, **bounds)
+        fields = export.TWEET_FIELDS
+    elif kind == "memories":
+        if topic or model:
+            typer.echo("--topic and --model only apply to tweets.", err=True)
+            raise typer.Exit(code=1)
+        rows = db.iter_memory(key=key, **bounds)
+        fields = export.MEMORY_FIELDS
+    else:
+        typer.echo(f"Unknown export kind '{kind}'. Choose 'tweets' or 'memories'.", err=True)
+        raise typer.Exit(code=1)
+
+    if output is None:
+        count = export.write_rows(rows, fields, fmt, sys.stdout)
+    else:
+        with output.open("w", encoding="utf-8", newline="") as stream:
+            count = export.write_rows(rows, fields, fmt, stream)
+        typer.echo(f"Exported {count} {kind} to {output}.", err=True)
+
 
 def main(argv: Optional[list[str]] = None) -> None:
     app(prog_name="twitter-agent", standalone_mode=False, args=argv)
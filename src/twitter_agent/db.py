@@ -4,7 +4,7 @@ import os
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional
 
 from sqlalchemy import Column, DateTime, Integer, String, Text, create_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
@@ -22,7 +22,7 @@ class MemoryEntry(Base):
     id = Column(Integer, primary_key=True)
     key = Column(String(128), nullable=False)
     value = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
 
 class TweetRecord(Base):
@@ -32,7 +32,7 @@ class TweetRecord(Base):
     content = Column(Text, nullable=False)
     topic = Column(String(128), nullable=True)
     model = Column(String(64), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
 
 def _ensure_db_dir(db_path: Path) -> None:
@@ -53,6 +53,10 @@ SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, class_=Session)
 
 def init_db() -> None:
     Base.metadata.create_all(bind=engine)
+    # create_all skips indexes on tables that already exist, so add them to older databases.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
 
 @contextmanager
@@ -76,14 +80,73 @@ def add_memory(key: str, value: str) -> MemoryEntry:
         return entry
 
 
-def list_memory(limit: Optional[int] = None) -> Iterable[MemoryEntry]:
+def _filter_rows(
+    query,
+    model,
+    *,
+    before_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+    after: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+):
+    if before_id is not None:
+        query = query.filter(model.id < before_id)
+    if after_id is not None:
+        query = query.filter(model.id > after_id)
+    if after is not None:
+        query = query.filter(model.created_at >= after)
+    if until is not None:
+        query = query.filter(model.created_at < until)
+    return query
+
+
+def _stream_rows(query, batch_size: int) -> Iterator[Dict[str, Any]]:
+    # Column queries skip the identity map and yield_per keeps only one batch buffered.
+    for row in query.yield_per(batch_size):
+        yield row._asdict()
+
+
+def list_memory(
+    limit: Optional[int] = None,
+    *,
+    key: Optional[str] = None,
+    before_id: Optional[int] = None,
+    after: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Iterable[MemoryEntry]:
     with session_scope() as session:
-        query = session.query(MemoryEntry).order_by(MemoryEntry.created_at.desc())
+        query = session.query(MemoryEntry)
+        if key:
+            query = query.filter(MemoryEntry.key == key)
+        query = _filter_rows(query, MemoryEntry, before_id=before_id, after=after, until=until)
+        query = query.order_by(MemoryEntry.id.desc())
         if limit:
             query = query.limit(limit)
         return list(reversed(query.all()))
 
 
+def iter_memory(
+    *,
+    key: Optional[str] = None,
+    before_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+    after: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    batch_size: int = 1000,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream memory entries oldest first as plain dicts without loading the table.
+    """
+    with session_scope() as session:
+        query = session.query(MemoryEntry.id, MemoryEntry.key, MemoryEntry.value, MemoryEntry.created_at)
+        if key:
+            query = query.filter(MemoryEntry.key == key)
+        query = _filter_rows(
+            query, MemoryEntry, before_id=before_id, after_id=after_id, after=after, until=until
+        )
+        yield from _stream_rows(query.order_by(MemoryEntry.id.asc()), batch_size)
+
+
 def add_tweet(content: str, topic: Optional[str], model: Optional[str]) -> TweetRecord:
     with session_scope() as session:
         record = TweetRecord(content=content, topic=topic, model=model)
@@ -91,3 +154,56 @@ def add_tweet(content: str, topic: Optional[str], model: Optional[str]) -> Tweet
         session.flush()
         return record
 
+
+def _filter_tweets(query, topic: Optional[str], model: Optional[str]):
+    if topic:
+        query = query.filter(TweetRecord.topic == topic)
+    if model:
+        query = query.filter(TweetRecord.model == model)
+    return query
+
+
+def list_tweets(
+    limit: int = 10,
+    *,
+    topic: Optional[str] = None,
+    model: Optional[str] = None,
+    before_id: Optional[int] = None,
+    after: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Iterable[TweetRecord]:
+    """
+    Return one page of tweets, newest first. Pass the last id as ``before_id`` to fetch the next page.
+    """
+    with session_scope() as session:
+        query = _filter_tweets(session.query(TweetRecord), topic, model)
+        query = _filter_rows(query, TweetRecord, before_id=before_id, after=after, until=until)
+        return list(query.order_by(TweetRecord.id.desc()).limit(limit).all())
+
+
+def iter_tweets(
+    *,
+    topic: Optional[str] = None,
+    model: Optional[str] = None,
+    before_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+    after: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    batch_size: int = 1000,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream tweets oldest first as plain dicts without loading the table.
+    """
+    with session_scope() as session:
+        query = session.query(
+            TweetRecord.id,
+            TweetRecord.content,
+            TweetRecord.topic,
+            TweetRecord.model,
+            TweetRecord.created_at,
+        )
+        query = _filter_tweets(query, topic, model)
+        query = _filter_rows(
+            query, TweetRecord, before_id=before_id, after_id=after_id, after=after, until=until
+        )
+        yield from _stream_rows(query.order_by(TweetRecord.id.asc()), batch_size)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import csv
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, TextIO
+
+FORMATS = ("jsonl", "csv")
+
+TWEET_FIELDS = ["id", "content", "topic", "model", "created_at"]
+MEMORY_FIELDS = ["id", "key", "value", "created_at"]
+
+
+def _serialize(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def write_rows(rows: Iterable[Dict[str, Any]], fields: List[str], fmt: str, stream: TextIO) -> int:
+    """
+    Write rows to ``stream`` one at a time and return how many were written.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=fields)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({name: _serialize(row.get(name)) for name in fields})
+            count += 1
+    else:
+        for row in rows:
+            payload = {name: _serialize(row.get(name)) for name in fields}
+            stream.write(json.dumps(payload, ensure_ascii=False))
+            stream.write("\n")
+            count += 1
+    return count